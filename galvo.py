@@ -2,13 +2,19 @@
 .. include:: ./README.md
 """
 
+import asyncio
 import warnings
 import time
-from copy import deepcopy
+import math
+from functools import lru_cache, partial
 
 import numpy as np
 
 SCALING = [0.5, 0.8, 1]
+# Axes that a Galvo driver can control
+AXES = ("x", "z")
+# Number of positions the history of a GalvoDriver holds before growing
+HISTORY_INIT_SIZE = 1024
 
 class GalvoDriver:
     """
@@ -30,6 +36,14 @@ class GalvoDriver:
         LabJack object if it is connected physically, by default False.
         Make sure to add Updater and Streamer to LabJack object that have
         matching input and output registers.
+    history_size : int, optional
+        Number of most recent positions kept in the position history, by
+        default None which keeps every position.
+
+    Raises
+    ------
+    ValueError
+        history_size must be an integer of at least 1.
 
     === UNUSED ===
     V_per_deg : float, optional
@@ -68,15 +82,18 @@ class GalvoDriver:
     >>> galvos.pos
     0
     """
-    def __init__(self, axis, dac_name, pos_init=0, daq=False):
+    def __init__(self, axis, dac_name, pos_init=0, daq=False, history_size=None):
         """Inits a GalvoDriver object."""
         # if V_per_deg not in SCALING:
         #     raise ValueError("{0} is not a valid volts / degree scaling option must be in {1}.".format(
         #         V_per_deg, SCALING))
 
-        if axis not in ["x", "z"]:
+        if axis not in AXES:
             raise ValueError(
                 "axis should be either 'x' (parallel to surface of rod) or 'z' (radially away from rod)")
+        if history_size is not None and (
+                not isinstance(history_size, (int, np.integer)) or history_size < 1):
+            raise ValueError("history_size should be an integer of at least 1.")
 
          # axis of the galvo mirror the driver is controlling
         self.axis = axis
@@ -88,10 +105,24 @@ class GalvoDriver:
 
         # must initialise for point adding later
         self.__point = Point(self.axis, pos_init)
-        self._point_history = [Point(self.axis, pos_init)]
+        # absolute positions of previous points, grown by doubling when full
+        # or trimmed to the newest positions if the history is bounded
+        self._history_size = None if history_size is None else int(history_size)
+        self._hist = np.empty(HISTORY_INIT_SIZE, dtype=np.float64)
+        self._hist_n = 0
+        # saturation compensated history, only extended when it is read
+        self._hist_unsat = []
+        self._append_history(self.__point.pos)
+        # stream buffer reused by every streamed move
+        self._bits_buf = np.empty(0, dtype=np.int32)
 
         self.set_origin(pos_init)
-        self.go_to(pos_init, 0)
+        if self.daq:
+            self.go_to(pos_init, 0)
+        else:
+            # nothing to send without a DAQ, only the stored position is set as
+            # go_to would, without building a Move
+            self._set_pos_noop(pos_init)
 
     @property
     def pos(self) -> float:
@@ -115,7 +146,18 @@ class GalvoDriver:
         
         With saturation compensation.        
         """
-        return [pnt.pos_unsat for pnt in self._point_history]
+        n_converted = len(self._hist_unsat)
+        if n_converted < self._hist_n:
+            new_hist = self._hist[n_converted:self._hist_n]
+            # same conversion as Point.pos_unsat, applied to every position
+            # added since the history was last read
+            self._hist_unsat.extend(Point.volt_to_pos(
+                self.axis,
+                Point.pos_to_volt(self.axis, new_hist) - SATURATION_COMP[self.axis]
+                ).tolist())
+        if self._history_size is not None:
+            return self._hist_unsat[-self._history_size:]
+        return list(self._hist_unsat)
 
     def reset_pos(self):
         """Immediately reset position to origin."""
@@ -186,15 +228,26 @@ class GalvoDriver:
 
         # movement with labjack, for other DAQs write another conditional
         if self.daq:
+            # None until set by the DAQ
+            actual_t = None
+            actual_V = None
             # second condition of move.t == 0 is used when pos_init and pos_final are the same
             # but speed > 0 resulting in trying to stream when you can't
             if speed == 0 or move.t == 0:
                 # Updating DAC#_BINARY with bit of closest position
                 actual_t = 0
-                actual_V = self.daq.update.update((move.bits[-1],))
+                actual_V = self.daq.update.update((move.bit_final,))
             else:
+                n_bits = move.n_bits
+                if self._bits_buf.size < n_bits:
+                    # grown by doubling so moves of similar lengths, such as
+                    # raster lines, reuse the same buffer
+                    self._bits_buf = np.empty(
+                        max(n_bits, 2*self._bits_buf.size), dtype=np.int32
+                        )
+                bits = move.bits_into(self._bits_buf)
                 self.daq.stream_out.configure_stream()
-                self.daq.stream_out.load_data((move.bits,), "int")
+                self.daq.stream_out.load_data((bits,), "int")
                 actual_t = self.daq.stream_out.start_stream(move.t)
                 actual_V = self.daq.update.read()
 
@@ -204,27 +257,95 @@ class GalvoDriver:
             # until the full stream has occurred, only then is the KeyboardInterrupt signal
             # handled
             # TODO: run laser and this on separate stream to be able to shutdown one immediately
-            try:
-                actual_V
-            except NameError:
+            if actual_V is None:
                 # using new_pos because the stream is blocked until it's finished
                 self._pos = new_pos
-                actual_point = Point(self.axis, new_pos)
+                actual_pos = Point(self.axis, new_pos).pos
             else:
-                actual_point = Point(self.axis, voltage=actual_V[self.dac_name])
+                actual_pos = Point.pos_from_voltage(self.axis, actual_V[self.dac_name])
 
-            try:
-                actual_t
-            except NameError:
+            if actual_t is None:
                 actual_t = move.t
 
             # TODO: Might need to raise KeyboardInterrupt here?
         else:
             self._pos = new_pos
             actual_t = 0
-            actual_point = Point(self.axis, self.pos)
+            # limited back into the DAC range as the DAQ branch is
+            actual_pos = Point._position_limits(self.axis, self.pos)
+
+        return actual_pos, actual_t
+
+    def go_to_many(self, new_pos, speed: float=0) -> list:
+        """
+        Go to each relative position in μm in turn at μm/s.
+
+        Same as calling ``go_to`` for every position. Without streaming, the
+        bits of every position are converted at once and only the DAQ writes
+        are done one position at a time.
+
+        Parameters
+        ----------
+        new_pos : array_like
+            New positions from origin in μm, in the order to go to them.
+        speed : float, optional
+            Speed in μm/s, by default 0 μm/s.
+
+        Returns
+        -------
+        list of tuples
+            The tuple returned by ``go_to`` for every position.
 
-        return actual_point.pos, actual_t
+        Raises
+        ------
+        KeyboardInterrupt
+            Moving stopped by user.
+        """
+        if not self.daq or speed != 0:
+            return [self.go_to(pos, speed) for pos in new_pos]
+
+        bits = Point.positions_to_bits(
+            self.axis, np.asarray(new_pos, dtype=np.float64) + self.origin
+            )
+        moved = []
+        for bit in bits.tolist():
+            # same as the update branch of go_to
+            actual_V = self.daq.update.update((bit,))
+            actual_pos = Point.pos_from_voltage(self.axis, actual_V[self.dac_name])
+            moved.append((actual_pos, 0))
+        return moved
+
+    async def go_to_async(self, new_pos: float, speed: float):
+        """
+        Go to relative position in μm from current position at μm/s, without
+        blocking the event loop.
+
+        Same as ``go_to`` but a streamed move, which blocks until the whole
+        stream has finished, is run in the default executor so other tasks can
+        run meanwhile. Moves without streaming are done directly.
+
+        Parameters
+        ----------
+        new_pos : float
+            New position from origin in μm.
+        speed : float
+            Speed in μm/s.
+
+        Returns
+        -------
+        tuple
+            Same as ``go_to``.
+
+        Notes
+        -----
+        Only one move should be awaited at a time for each GalvoDriver as the
+        stored position is updated from the executor thread.
+        """
+        if not self.daq or speed == 0:
+            return self.go_to(new_pos, speed)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.go_to, new_pos, speed)
 
     #=======================================================
     # PRIVATE METHODS
@@ -243,7 +364,7 @@ class GalvoDriver:
     @_point.setter
     def _point(self, val):
         """Set the Point object where ``val`` should be a Point object."""
-        self._point_history.append(deepcopy(self._point))
+        self._append_history(self.__point.pos)
         self.__point = val
 
     @property
@@ -266,15 +387,54 @@ class GalvoDriver:
         """Set absolute voltage in V."""
         self._point = Point(self.axis, voltage=val)
 
+    def _set_pos_noop(self, new_pos: float) -> float:
+        """
+        Set position relative to the origin in μm without moving the mirror.
+
+        Only the stored position and history are updated, no Move is built
+        and nothing is sent to the DAQ.
+
+        Parameters
+        ----------
+        new_pos : float
+            New position from origin in μm.
+
+        Returns
+        -------
+        float
+            Absolute position in μm, with saturation compensation.
+        """
+        self._pos = new_pos + self.origin
+        return self.pos
+
     def _revert_pos(self):
         """
         Revert to the most recent position, without sending command to DAQ
 
         UNUSED
         """
-        temp_point = deepcopy(self._point)
-        self._point = deepcopy(self._point_history[-1])
-        self._point_history.append(temp_point)
+        # swap directly rather than through the _point setter, which would
+        # also append the replaced position to the history
+        temp_pos = self.__point.pos
+        self.__point = Point(self.axis, self._hist[self._hist_n - 1])
+        self._append_history(temp_pos)
+
+    def _append_history(self, pos: float):
+        """Append an absolute position in μm to the position history."""
+        if self._hist_n == self._hist.size:
+            if self._history_size is not None and self._hist_n >= 2*self._history_size:
+                # a bounded history only keeps the newest positions, trimmed
+                # in one go once the buffer holds at least double the size so
+                # appending stays O(1) on average
+                keep = self._history_size - 1
+                dropped = self._hist_n - keep
+                self._hist[:keep] = self._hist[dropped:self._hist_n]
+                self._hist_n = keep
+                del self._hist_unsat[:dropped]
+            else:
+                self._hist = np.concatenate((self._hist, np.empty_like(self._hist)))
+        self._hist[self._hist_n] = pos
+        self._hist_n += 1
 
 
 class GalvoDrivers:
@@ -305,13 +465,20 @@ class GalvoDrivers:
         LabJack object if it is connected physically, by default False.
         Make sure to add Updater and Streamer to LabJack object that have
         matching input and output registers.
+    history_size : int, optional
+        Number of most recent positions kept in the position history of each
+        axis, by default None which keeps every position.
 
     Raises
     ------
+    TypeError
+        Input axis must be an iterable and not a string
     KeyError
         dac_name dict keys doesn't match the input axis.
     KeyError
         pos_init dict keys doesn't match the input axis.
+    ValueError
+        history_size must be an integer of at least 1.
 
     Examples
     --------
@@ -341,20 +508,27 @@ class GalvoDrivers:
     >>> galvos.pos
     {"x": 0, "z": 0}
     """
-    def __init__(self, axis, dac_name: dict, pos_init: dict, daq=False):
+    def __init__(
+        self, axis, dac_name: dict, pos_init: dict, daq=False, history_size=None):
         """Inits a GalvoDrivers object."""
+        try:
+            if not isinstance(axis, str):
+                iter(axis)
+            else:
+                raise TypeError
+        except TypeError:
+            raise TypeError("Argument axes must be an iterable and not a string")
         self.axis = axis
 
-        for ax in self.axis:
-            try:
-                dac_name[ax]
-            except KeyError:
-                raise KeyError("Input dac_name axes is missing '{0}'-axis".format(ax))
+        missing_dac = set(self.axis) - dac_name.keys()
+        if missing_dac:
+            raise KeyError("Input dac_name axes is missing {0}-axis".format(
+                ", ".join("'{0}'".format(ax) for ax in sorted(missing_dac))))
 
-            try:
-                pos_init[ax]
-            except KeyError:
-                raise KeyError("Input pos_init axes is missing '{0}'-axis".format(ax))
+        missing_pos = set(self.axis) - pos_init.keys()
+        if missing_pos:
+            raise KeyError("Input pos_init axes is missing {0}-axis".format(
+                ", ".join("'{0}'".format(ax) for ax in sorted(missing_pos))))
 
         self.dac_name = dac_name
         self.daq = daq
@@ -363,49 +537,45 @@ class GalvoDrivers:
         for ax in self.axis:
             # using the Galvo objects for the axes as storage for points rather than
             # sending labjack/DAQ commands through them
-            self._galvos[ax] = GalvoDriver(ax, self.dac_name[ax], pos_init=pos_init[ax], daq=False)
+            self._galvos[ax] = GalvoDriver(
+                ax, self.dac_name[ax], pos_init=pos_init[ax], daq=False,
+                history_size=history_size
+                )
+        # fixed axis order paired with the matching galvo for iterating in a
+        # single pass without looking up each galvo by name
+        self._axis_galvos = tuple(self._galvos.items())
 
-        self.go_to(**pos_init, speed=0)
+        if self.daq:
+            self.go_to(**pos_init, speed=0)
+        else:
+            # nothing to send without a DAQ, only the stored positions are set
+            # as go_to would, without building a MoveMultiDim
+            for ax, galvo in self._axis_galvos:
+                galvo._set_pos_noop(pos_init[ax])
 
     @property
     def pos(self) -> dict:
         """Return absolute positions for all stored 1D galvos in μm."""
-        _pos = {}
-        for ax in self.axis:
-            _pos[ax] = self._galvos[ax].pos
-        return _pos
+        return {ax: g.pos for ax, g in self._axis_galvos}
 
     @property
     def rel_pos(self) -> dict:
         """Return relative positions for all stored 1D galvos in μm."""
-        _rel_pos = {}
-        for ax in self.axis:
-            _rel_pos[ax] = self._galvos[ax].rel_pos
-        return _rel_pos
+        return {ax: g.rel_pos for ax, g in self._axis_galvos}
 
     @property
     def pos_history(self) -> dict:
         """Return absolute position history for all stored 1D galvos."""
-        _pos_history = {}
-        for ax in self.axis:
-            _pos_history[ax] = self._galvos[ax].pos_history
-        return _pos_history
+        return {ax: g.pos_history for ax, g in self._axis_galvos}
 
     def reset_pos(self):
         """Reset the relative positions of all stored 1D galvos to 0 μm."""
-        rst_pos = {}
-        for ax in self.axis:
-            rst_pos[ax] = 0
-
-        self.go_to(speed=0, **rst_pos)
+        self.go_to(speed=0, **{ax: 0 for ax, _ in self._axis_galvos})
 
     @property
     def origin(self) -> dict:
         """Return origin for all stored 1D galvos in μm."""
-        _origin = {}
-        for ax in self.axis:
-            _origin[ax] = (self._galvos[ax].origin)
-        return _origin
+        return {ax: g.origin for ax, g in self._axis_galvos}
 
     def set_origin(self, **orig):
         """
@@ -418,19 +588,19 @@ class GalvoDrivers:
         orig : optional, {axis_name: origin}
             Origin in μm for each galvo axis.
         """
-        for ax in self.axis:
+        for ax, galvo in self._axis_galvos:
             if not orig:
-                self._galvos[ax].set_origin()
+                galvo.set_origin()
             else:
                 try:
-                    self._galvos[ax].set_origin(orig[ax])
+                    galvo.set_origin(orig[ax])
                 except KeyError:
                     print("Axis '{0}' not found in input choices, it remains unchanged".format(ax))
 
     def reset_origin(self):
         """Set the origin of all stored 1D galvos to 0 μm."""
-        for ax in self.axis:
-            self._galvos[ax].set_origin(0)
+        for _, galvo in self._axis_galvos:
+            galvo.set_origin(0)
 
     def go_to(self, speed: float=0, **new_pos) -> tuple:
         """
@@ -462,21 +632,29 @@ class GalvoDrivers:
             Moving stopped by user.
         """
         # use stored 1D galvos to calculate the new absolute position for each axis
-        original_pos = self.pos
+        original_pos = {}
         new_abs_pos = {}
-        for ax in self.axis:
-            try:
-                new_abs_pos[ax] = self._galvos[ax].go_to(new_pos[ax], speed)[0]
-            except KeyError:
-                # Axis is not provided
-                new_abs_pos[ax] = self._galvos[ax].go_to(original_pos[ax], speed)[0]
+        for ax, galvo in self._axis_galvos:
+            original_pos[ax] = galvo.pos
+            # only the stored position is updated, the bits for every axis are
+            # built once by MoveMultiDim below
+            if ax in new_pos:
+                new_abs_pos[ax] = galvo._set_pos_noop(new_pos[ax])
+            else:
+                # axis is not provided so it stays where it is, still added to
+                # the history so every axis has the same number of positions
+                galvo._append_history(galvo._point.pos)
+                new_abs_pos[ax] = original_pos[ax]
 
         move = MoveMultiDim(self.axis, original_pos, new_abs_pos, speed)
 
         if self.daq:
+            # None until set by the DAQ
+            actual_t = None
+            actual_V = None
             if speed == 0 or move.t == 0:
                 # Updater wants a tuple of values matching the number of write registers
-                move_bits = tuple([mb[-1] for mb in tuple(move.bits.values())])
+                move_bits = tuple(move.bit_final.values())
                 actual_t = 0
                 actual_V = self.daq.update.update(move_bits)
             else:
@@ -487,35 +665,66 @@ class GalvoDrivers:
                 actual_t = self.daq.stream_out.start_stream(move.t)
                 actual_V = self.daq.update.read()
 
-            try:
-                actual_V
-            except NameError:
+            if actual_V is None:
                 # stored galvos already have their positions set to the new position
                 actual_V = self.daq.update.read()
-                stopped_pos = []
-                for ax in self.axis:
-                    self._galvos[ax].voltage = actual_V[self._galvos[ax].dac_name]
-                    stopped_pos.append(str(self._galvos[ax].pos))
-            finally:
-                actual_pos = {}
-                for ax in self.axis:
-                    actual_pos[ax] = Point(ax, voltage=actual_V[self._galvos[ax].dac_name]).pos
-
-            try:
-                actual_t
-            except NameError:
+            actual_pos = {
+                ax: Point.pos_from_voltage(ax, actual_V[galvo.dac_name])
+                for ax, galvo in self._axis_galvos
+                }
+
+            if actual_t is None:
                 actual_t = move.t
 
             # TODO: Might need to raise KeyboardInterrupt here?
         else:
-            # no connected DAQs
+            # no connected DAQs, the stored galvos already hold the new positions,
+            # limited back into the DAC range as the DAQ branch is
             actual_t = 0
-            actual_pos = {}
-            for ax in self.axis:
-                actual_pos[ax] = Point(ax, new_pos[ax]).pos
+            actual_pos = {
+                ax: Point._position_limits(ax, pos)
+                for ax, pos in new_abs_pos.items()
+                }
 
         return actual_pos, actual_t
 
+    async def go_to_async(self, speed: float=0, **new_pos) -> tuple:
+        """
+        Go to input relative positions in μm input speed in μm/s for all axes,
+        without blocking the event loop.
+
+        Same as ``go_to`` but a streamed move, which blocks until the whole
+        stream has finished, is run in the default executor so other tasks can
+        run meanwhile. All axes are already streamed together so there is
+        nothing to run concurrently per axis. Moves without streaming are done
+        directly.
+
+        Parameters
+        ----------
+        speed : float, optional
+            Speed in μm/s, by default 0 μm/s.
+        new_pos : optional, {axis_name: new_pos}
+            New position from origin in μm, by default no movement for given
+            axis.
+
+        Returns
+        -------
+        tuple
+            Same as ``go_to``.
+
+        Notes
+        -----
+        Only one move should be awaited at a time for each GalvoDrivers as the
+        stored positions are updated from the executor thread.
+        """
+        if not self.daq or speed == 0:
+            return self.go_to(speed, **new_pos)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, partial(self.go_to, speed, **new_pos)
+            )
+
 MAX_SPEED = 10e3
 
 class Move():
@@ -541,6 +750,8 @@ class Move():
     ----------
     t
     bits
+    bit_final
+    n_bits
 
     Examples
     --------
@@ -548,19 +759,34 @@ class Move():
     >>> move.t
     >>> move.bits
     """
+    # a Move is created for every go_to, and one per axis for MoveMultiDim
+    __slots__ = (
+        "_axis", "_speed", "_pos_init", "_pos_final", "_bit_init", "_bit_final",
+        "_bits"
+        )
+
     def __init__(
         self, axis: str, pos_init: float, pos_final: float, speed: float):
         """Inits a Move object."""
+        if axis not in AXES:
+            raise ValueError("Axis should be 'x' or 'z'.")
         self._axis = axis
-        self._point_init = Point(axis, pos_init)
-        self._point_final = Point(axis, pos_final)
         self._speed = speed
 
+        # only the endpoint positions and bits are needed, so they are
+        # converted directly without creating any Points
+        self._pos_init = Point._position_limits(axis, pos_init)
+        self._pos_final = Point._position_limits(axis, pos_final)
+        self._bit_init = Point.pos_to_bit(axis, pos_init)
+        self._bit_final = Point.pos_to_bit(axis, pos_final)
+        # bits are only calculated when first requested
+        self._bits = None
+
     @property
     def t(self) -> float:
         """Return movement time in seconds, if speed=0μm/s then t=0s."""
         if self._speed != 0:
-            _t = abs(self._point_init.pos - self._point_final.pos) / self._speed
+            _t = abs(self._pos_init - self._pos_final) / self._speed
         else:
             _t = 0
         return _t
@@ -577,18 +803,80 @@ class Move():
         Notes
         -----
         If speed=0μm/s, return array of length 1.
+
+        Computed once on first access and cached for the lifetime of the Move.
         """
-        if self._point_init.bit < self._point_final.bit:
-            bin_steps = np.arange(
-                self._point_init.bit, self._point_final.bit + 1, DAC_SET_BITS
+        if self._bits is None:
+            self._bits = self._bit_range(
+                self._bit_init, self._bit_final, DAC_SET_BITS
                 )
-        else:
-            # if point_init is greater than point_final, then switch np.arange
-            # start and stop then reverse array
-            bin_steps = np.arange(
-                self._point_final.bit, self._point_init.bit + 1, DAC_SET_BITS
-                )[::-1]
-        return bin_steps
+        return self._bits
+
+    @property
+    def bit_final(self) -> int:
+        """Return bit of the final position, the last of ``Move.bits``."""
+        return self._bit_final
+
+    @property
+    def n_bits(self) -> int:
+        """Return the number of bits between initial and final."""
+        return abs(self._bit_final - self._bit_init) // DAC_SET_BITS + 1
+
+    def bits_into(self, buf: np.array) -> np.array:
+        """
+        Write the bits for every point between initial and final into buf.
+
+        Same values as ``Move.bits`` without allocating a new array, so a
+        single buffer can be reused for streaming many moves.
+
+        Parameters
+        ----------
+        buf : np.array
+            32bit integer array with at least ``n_bits`` elements.
+
+        Returns
+        -------
+        np.array
+            View of the first ``n_bits`` elements of buf.
+        """
+        bits = buf[:self.n_bits]
+        direction = 1 if self._bit_final >= self._bit_init else -1
+        # every step is the same so a running sum of the steps from the first
+        # bit fills the buffer in place
+        bits.fill(direction * DAC_SET_BITS)
+        bits[0] = self._bit_init
+        np.cumsum(bits, out=bits)
+        return bits
+
+    @staticmethod
+    def _bit_range(bit_init: int, bit_final: int, step: int) -> np.array:
+        """
+        Return every ``step`` bits from ``bit_init`` towards ``bit_final``.
+
+        Parameters
+        ----------
+        bit_init : int
+            First bit in the sequence.
+        bit_final : int
+            Last bit in the sequence, included if it lies on a step.
+        step : int
+            Positive spacing between consecutive bits.
+
+        Returns
+        -------
+        array of ints
+
+        Examples
+        --------
+        >>> Move._bit_range(40, 8, 16)
+        array([40, 24,  8], dtype=int32)
+        """
+        direction = 1 if bit_final >= bit_init else -1
+        # signed step covers both directions in a single contiguous array, so
+        # no reversed copy is needed when moving towards lower bits
+        return np.arange(
+            bit_init, bit_final + direction, direction * step, dtype=np.int32
+            )
 
     @staticmethod
     def speed_limits(spd: float) -> float:
@@ -604,12 +892,7 @@ class Move():
         -------
         float
         """
-        if spd < 0:
-            return 0
-        elif spd > MAX_SPEED:
-            return MAX_SPEED
-        else:
-            return spd
+        return 0 if spd < 0 else (MAX_SPEED if spd > MAX_SPEED else spd)
 
 class MoveMultiDim():
     """
@@ -632,6 +915,9 @@ class MoveMultiDim():
     ----------
     t
     bits
+    bit_final
+    bit_matrix
+    interleaved
 
     Raises
     ------
@@ -644,6 +930,8 @@ class MoveMultiDim():
     >>> move.t
     >>> move.bits
     """
+    __slots__ = ("_axis", "_speed", "_t", "_moves", "_bit_matrix", "_bits")
+
     def __init__(self, axis, pos_init: dict, pos_final: dict, speed: float):
         """Inits a MoveMultiDim object."""
         try:
@@ -654,19 +942,20 @@ class MoveMultiDim():
         except TypeError:
             raise TypeError("Argument axes must be an iterable and not a string")
         else:
-            self._axis = axis
+            # fixed order that can be iterated repeatedly, even for generators
+            self._axis = tuple(axis)
         self._speed = speed
-        self._t = 0
 
-        self._moves = {}
-        for ax in self._axis:
-            self._moves[ax] = Move(
-                ax, pos_init[ax], pos_final[ax], self._speed
-                )
+        self._moves = {
+            ax: Move(ax, pos_init[ax], pos_final[ax], self._speed)
+            for ax in self._axis
+            }
+        # set movement time to the longest time out of all axes
+        self._t = max((move.t for move in self._moves.values()), default=0)
 
-            # set movement time to the longest time out of all axes
-            if self._moves[ax].t > self._t:
-                self._t = self._moves[ax].t
+        # bits are only calculated when first requested
+        self._bits = None
+        self._bit_matrix = None
 
     @property
     def t(self) -> float:
@@ -676,10 +965,55 @@ class MoveMultiDim():
     @property
     def bits(self) -> dict:
         """Return bit array for all axes."""
-        _bits = {}
-        for ax in self._axis:
-            _bits[ax] = self._moves[ax].bits
-        return _bits
+        if self._bits is None:
+            self._bits = {ax: move.bits for ax, move in self._moves.items()}
+        return self._bits
+
+    @property
+    def bit_final(self) -> dict:
+        """Return bit of the final position for all axes."""
+        return {ax: move.bit_final for ax, move in self._moves.items()}
+
+    @property
+    def bit_matrix(self) -> np.array:
+        """
+        Return bits for all axes as a single array of shape (n_axes, n_steps).
+
+        Rows follow the order of the input axes. Axes that finish moving
+        before the longest axis are held at their final bit.
+
+        Each axis is contiguous in memory, so ``bit_matrix.T`` is a
+        Fortran-ordered (n_steps, n_axes) view without any copy.
+        """
+        if self._bit_matrix is None:
+            # axes with shorter moves hold their final bit until the longest
+            # move has finished
+            n_steps = max((bits.size for bits in self.bits.values()), default=0)
+            self._bit_matrix = np.empty(
+                (len(self._moves), n_steps), dtype=np.int32
+                )
+            for row, bits in zip(self._bit_matrix, self.bits.values()):
+                row[:bits.size] = bits
+                row[bits.size:] = bits[-1]
+        return self._bit_matrix
+
+    @property
+    def interleaved(self) -> np.array:
+        """
+        Return bits for all axes interleaved step by step in a single array.
+
+        For two axes the order is ``x[0], z[0], x[1], z[1], ...``, following
+        the order of the input axes, for streams expecting one contiguous
+        buffer of samples. Axes are held at their final bit as in
+        ``bit_matrix``.
+
+        Examples
+        --------
+        >>> move = MoveMultiDim(["x", "z"], {"x": 0, "z": 0}, {"x": 1, "z": 1}, 0)
+        >>> move.interleaved
+        """
+        # a single copy done by numpy, the transposed view is not contiguous
+        return self.bit_matrix.T.reshape(-1)
 
 # Voltage range of the DAC
 DAC_RANGE =         [0, 5]
@@ -687,10 +1021,12 @@ DAC_RANGE =         [0, 5]
 DAC_BITS =          12
 # Number of bits Labjack DAC can be set to
 DAC_SET_BITS =      16
-# DAC voltage steps
-VOLTAGE_LEVELS =    np.linspace(
-    DAC_RANGE[0], DAC_RANGE[1], num=2**DAC_BITS, endpoint=True
-    )
+# Middle of the DAC_SET_BITS steps between two DAC_BITS levels
+MIDDLE_BIT =        1 << (DAC_SET_BITS - DAC_BITS - 1)
+# Highest DAC_BITS level
+MAX_LEVEL =         2**DAC_BITS - 1
+# Spacing of the evenly spaced DAC voltage steps
+VOLTAGE_STEP =      (DAC_RANGE[1] - DAC_RANGE[0]) / MAX_LEVEL
 # Converts positions to μm
 POSITION_UNIT_PREFIX = 1e6
 # Full length range of DAC in m
@@ -699,7 +1035,8 @@ CALIBRATION = {
     "z": 12.5e-3   # 13.24e-3 for other galvo 2021.01.19
 }
 # Provides "slope" and "intercept" in voltage = slope*pos + intercept for both
-# axes
+# axes. Read once at import into POSITION_LIMITS and _POS_TO_BIT, so changing
+# it at runtime leaves those conversions with the old calibration
 POSITION_TO_VOLTAGE = {
     "x": {
         "slope": (
@@ -716,6 +1053,9 @@ POSITION_TO_VOLTAGE = {
         "intercept": DAC_RANGE[1]/2
     }
 }
+# Inverse of each slope so converting voltage to position is a multiplication
+for _conversion in POSITION_TO_VOLTAGE.values():
+    _conversion["inv_slope"] = 1 / _conversion["slope"]
 
 # Both LabJack DACs suffer from saturation where they cannot output more than ~4.85V.
 # So setting V=5V will result in V=~4.85V.
@@ -725,6 +1065,12 @@ SATURATION_COMP = {
     "x": -0.2, # Volts
     "z": 0
 }
+# Lowest and highest voltage that can be set for each axis, including the
+# saturation compensation
+VOLTAGE_LIMITS = {
+    ax: (min(DAC_RANGE), max(DAC_RANGE) + SATURATION_COMP[ax])
+    for ax in SATURATION_COMP
+}
 
 # The calibration is assuming that the origin can be set at exactly the centre
 # of the rod in the z direction. We cannot so this is a correction to set the
@@ -740,11 +1086,24 @@ SATURATION_COMP = {
 #                  ---------------------------------------------
 # Alters the equation to:
 #   voltage = slope * (pos + correction) + intercept
+# Read once at import into _POS_TO_BIT, so it is fixed for position to bit
+# conversions even if changed at runtime
 POSITION_CENTRE_CORRECTION = {
     "x": 0 / POSITION_UNIT_PREFIX,
     "z": 0 / POSITION_UNIT_PREFIX
     }
 
+# Lowest and highest position in μm for each axis, from VOLTAGE_LIMITS. Sorted
+# as a negative slope swaps which voltage limit gives the lowest position.
+# Computed once at import, and read once more into _POS_TO_BIT
+POSITION_LIMITS = {
+    ax: tuple(sorted(
+        (volt - POSITION_TO_VOLTAGE[ax]["intercept"]) * POSITION_TO_VOLTAGE[ax]["inv_slope"]
+        for volt in VOLTAGE_LIMITS[ax]
+        ))
+    for ax in VOLTAGE_LIMITS
+}
+
 class Point():
     """
     A single axis point in space representing beam position directed by Galvo.
@@ -768,7 +1127,7 @@ class Point():
     --------
     >>> p = Point("x", pos=1400)
     >>> print(p.pos)
-    1399.9999999999998
+    1400.0
     >>> print(p.bit)
     58120
     >>> print(p.voltage)
@@ -782,17 +1141,22 @@ class Point():
 
     TODO: handle different speeds.
     """
+    # Points are created for every move so avoid a per-instance __dict__
+    __slots__ = ("_axis", "_pos", "_voltage", "_bit")
+
     def __init__(self, axis: str, pos : float=None, voltage: float=None):
         """Inits a Point object."""
-        if axis not in ["x", "z"]:
+        if axis not in AXES:
             raise ValueError("Axis should be 'x' or 'z'.")
         if pos == None and voltage == None:
             raise ValueError("Either pos or voltage should not be None.")
 
         self._axis = axis
+        # bit is only calculated when first requested
+        self._bit = None
 
         if pos != None:
-            self._pos = self._position_limits(pos)
+            self._pos = self._position_limits(self._axis, pos)
             # converting position to voltage
             self._voltage = self.pos_to_volt(self._axis, self._pos)
         elif voltage != None:
@@ -804,15 +1168,96 @@ class Point():
         """Adds two Points, position and voltage, from the same axis."""
         if self._axis != other_point._axis:
             raise ValueError("Adding two points in different axes.")
-        new_pos = self.pos + other_point.pos
-        return Point(self._axis, pos=new_pos)
+        return Point._from_pos(self._axis, self.pos + other_point.pos)
 
     def __sub__(self, other_point):
         """Substracts two Points, position and voltage, from the same axis."""
         if self._axis != other_point._axis:
             raise ValueError("Subtracting two points from different axes.")
-        new_pos = self.pos - other_point.pos
-        return Point(self._axis, pos=new_pos)
+        return Point._from_pos(self._axis, self.pos - other_point.pos)
+
+    @staticmethod
+    def _from_pos(axis: str, pos: float):
+        """
+        Return a Point from a position in μm on an already validated axis.
+
+        Same as ``Point(axis, pos)`` without checking the inputs again.
+        """
+        point = Point.__new__(Point)
+        point._axis = axis
+        point._bit = None
+        point._pos = Point._position_limits(axis, pos)
+        point._voltage = Point.pos_to_volt(axis, point._pos)
+        return point
+
+    @staticmethod
+    def from_array(axis: str, pos=None, voltage=None) -> tuple:
+        """
+        Return positions, voltages and bits of many points on a single axis.
+
+        Converts whole arrays at once rather than creating a Point for every
+        sample, giving the same values as ``Point(axis, pos=p)`` or
+        ``Point(axis, voltage=v)`` for each element.
+
+        Parameters
+        ----------
+        axis : str
+            Dimension of the points, related to the Galvo axis.
+        pos : array_like, optional
+            Absolute positions of the points in μm, by default None.
+        voltage : array_like, optional
+            Absolute voltages of the points in Volts, by default None.
+
+        Returns
+        -------
+        tuple of arrays
+            1 - positions in μm,
+            2 - voltages in Volts,
+            3 - bits, as 16bit unsigned integers.
+
+        Raises
+        ------
+        ValueError
+            Axis/coordinate has to be either "x" or "z".
+            Must have at least either an input position or voltage.
+
+        Examples
+        --------
+        >>> pos, volt, bits = Point.from_array("x", pos=[1400, 2000])
+        >>> bits
+        array([58120, 54936], dtype=uint16)
+        """
+        if axis not in AXES:
+            raise ValueError("Axis should be 'x' or 'z'.")
+        if pos is None and voltage is None:
+            raise ValueError("Either pos or voltage should not be None.")
+
+        if pos is not None:
+            # same conversions as Point._position_limits then Point.pos_to_volt
+            positions = np.clip(
+                np.asarray(pos, dtype=np.float64) + POSITION_CENTRE_CORRECTION[axis],
+                *POSITION_LIMITS[axis]
+                )
+            volts = Point.pos_to_volt(axis, positions)
+        else:
+            volts = np.clip(np.asarray(voltage, dtype=np.float64), *VOLTAGE_LIMITS[axis])
+            positions = Point.volt_to_pos(axis, volts)
+
+        # closest 12bit level, upshifted to 16bit and set to the middle step,
+        # stored as the 16bit unsigned values the DAC is written with
+        bits = (Point._closest_level(volts) << (DAC_SET_BITS - DAC_BITS)) | MIDDLE_BIT
+        return positions, volts, bits.astype(np.uint16)
+
+    @staticmethod
+    def _closest_level(volt):
+        """
+        Return the index of the closest DAC voltage level.
+
+        Array version of the level found in Point.bit, ties go to the lower
+        level.
+        """
+        level = np.ceil((volt - DAC_RANGE[0]) / VOLTAGE_STEP - 0.5)
+        return np.clip(level, 0, MAX_LEVEL).astype(np.int64)
 
     @property
     def pos(self) -> float:
@@ -847,18 +1292,164 @@ class Point():
         increasing the resolution to 16 bits to coarsen by 4 bits before
         finding the middle bit.
         """
-        # closest bit from voltage in 12bit levels, upshifted to 16bit
-        closest_bit = abs(VOLTAGE_LEVELS - self.voltage).argmin() << (DAC_SET_BITS - DAC_BITS)
-        # coarsening by 4 bits, and setting to the middle step
-        middle_bit = self._binary_coarsen(closest_bit, DAC_SET_BITS - DAC_BITS)
-        return middle_bit
+        if self._bit is None:
+            self._bit = self.volt_to_bit(self.voltage)
+        return self._bit
+
+    @staticmethod
+    def volt_to_bit(volt: float) -> int:
+        """
+        Return the bit corresponding to the closest voltage level.
+
+        Parameters
+        ----------
+        volt : float
+            Voltage in Volts.
+
+        Returns
+        -------
+        int
+
+        Notes
+        -----
+        As the voltage levels are evenly spaced the closest one is found
+        directly from the voltage rather than by searching every level.
+        """
+        # closest of the evenly spaced 12bit levels, ties to the lower level
+        level = math.ceil((volt - DAC_RANGE[0]) / VOLTAGE_STEP - 0.5)
+        level = 0 if level < 0 else (MAX_LEVEL if level > MAX_LEVEL else level)
+        # upshifted to 16bit leaves the low 4 bits clear, so coarsening
+        # and setting to the middle step is just setting the top one
+        return (level << (DAC_SET_BITS - DAC_BITS)) | MIDDLE_BIT
+
+    @staticmethod
+    def pos_to_bit(axis: str, pos: float) -> int:
+        """
+        Return the bit of a position in μm limited to the DAC range.
+
+        Same as ``Point(axis, pos).bit`` without creating a Point.
+
+        Parameters
+        ----------
+        axis : str
+            Dimension of the point, related to the Galvo axis.
+        pos : float
+            Absolute position in μm.
+
+        Returns
+        -------
+        int
+        """
+        # the conversion is memoised so the position must be hashable, which
+        # 0-d arrays aren't
+        return _POS_TO_BIT[axis](float(pos))
+
+    @staticmethod
+    def positions_to_bits(axis: str, pos, out: np.array=None) -> np.array:
+        """
+        Return the bits of many positions in μm limited to the DAC range.
+
+        Same as ``Point.pos_to_bit`` for each element, or the bits from
+        ``Point.from_array(axis, pos=pos)``, but only the bits are made. The
+        conversion is done in place in a single float buffer, and the bits can
+        be written straight into a preallocated buffer to stream from.
+
+        Parameters
+        ----------
+        axis : str
+            Dimension of the points, related to the Galvo axis.
+        pos : array_like
+            Absolute positions of the points in μm.
+        out : np.array, optional
+            16bit unsigned integer array with the same shape as pos to write
+            the bits into, by default None and a new array is made.
+
+        Returns
+        -------
+        np.array
+            Bits as 16bit unsigned integers, out if given.
+
+        Raises
+        ------
+        ValueError
+            Axis/coordinate has to be either "x" or "z".
+        """
+        if axis not in AXES:
+            raise ValueError("Axis should be 'x' or 'z'.")
+
+        correction = POSITION_CENTRE_CORRECTION[axis]
+        # same order of operations as Point._position_limits,
+        # Point.pos_to_volt then Point._closest_level
+        # always a new array, even for a scalar, so it can be written in place
+        volt = np.array(pos, dtype=np.float64)
+        volt += correction
+        np.clip(volt, *POSITION_LIMITS[axis], out=volt)
+        volt += correction
+        volt *= POSITION_TO_VOLTAGE[axis]["slope"]
+        volt += POSITION_TO_VOLTAGE[axis]["intercept"]
+        volt -= DAC_RANGE[0]
+        volt /= VOLTAGE_STEP
+        volt -= 0.5
+        np.ceil(volt, out=volt)
+        np.clip(volt, 0, MAX_LEVEL, out=volt)
+
+        if out is None:
+            out = np.empty(volt.shape, dtype=np.uint16)
+        np.copyto(out, volt, casting="unsafe")
+        out <<= DAC_SET_BITS - DAC_BITS
+        out |= MIDDLE_BIT
+        return out
+
+    @staticmethod
+    def _axis_pos_to_bit(axis: str):
+        """
+        Return a function converting positions in μm to bits for one axis.
+
+        The axis constants are looked up once and kept in the closure, the
+        arithmetic is the same as Point._position_limits and
+        Point.pos_to_volt.
+        """
+        slope = POSITION_TO_VOLTAGE[axis]["slope"]
+        inv_slope = POSITION_TO_VOLTAGE[axis]["inv_slope"]
+        intercept = POSITION_TO_VOLTAGE[axis]["intercept"]
+        correction = POSITION_CENTRE_CORRECTION[axis]
+        pos_lo, pos_hi = POSITION_LIMITS[axis]
+
+        def pos_to_bit(pos: float) -> int:
+            # limited as in Point.__init__ so the voltage, and so the bit, is
+            # identical
+            pos = pos + correction
+            pos = pos_lo if pos < pos_lo else (pos_hi if pos > pos_hi else pos)
+            return Point.volt_to_bit(slope * (pos + correction) + intercept)
+
+        return pos_to_bit
+
+    @staticmethod
+    def pos_from_voltage(axis: str, voltage: float) -> float:
+        """
+        Return the position in μm of a voltage limited to the DAC range.
+
+        Same as ``Point(axis, voltage=voltage).pos`` without creating a Point.
+
+        Parameters
+        ----------
+        axis : str
+            Dimension of the point, related to the Galvo axis.
+        voltage : float
+            Absolute voltage in Volts.
+
+        Returns
+        -------
+        float
+        """
+        return Point.volt_to_pos(axis, Point._voltage_limits(axis, voltage))
 
     @staticmethod
     def volt_to_pos(axis: str, volt: float) -> float:
         """Return voltage to position conversion."""
         new_pos = (
             (volt -  POSITION_TO_VOLTAGE[axis]["intercept"])
-            / POSITION_TO_VOLTAGE[axis]["slope"]
+            * POSITION_TO_VOLTAGE[axis]["inv_slope"]
             )
         return new_pos
 
@@ -875,27 +1466,22 @@ class Point():
     @staticmethod
     def _voltage_limits(axis: str, volt: float) -> float:
         """Return voltages within DAC range limits."""
-        if volt < min(DAC_RANGE):
-            return min(DAC_RANGE)
-        elif volt > (max(DAC_RANGE) + SATURATION_COMP[axis]):
-            return max(DAC_RANGE) + SATURATION_COMP[axis]
-        else:
-            return volt
+        volt_lo, volt_hi = VOLTAGE_LIMITS[axis]
+        return volt_lo if volt < volt_lo else (volt_hi if volt > volt_hi else volt)
 
-    def _position_limits(self, pos: float) -> float:
+    @staticmethod
+    def _position_limits(axis: str, pos: float) -> float:
         """Return positions within allowed DAC voltage range."""
-        set_voltage = self.pos_to_volt(self._axis, pos)
-        set_voltage = self._voltage_limits(self._axis, set_voltage)
-
-        set_pos = self.volt_to_pos(self._axis, set_voltage)
-        return set_pos
+        # both conversions are linear, so converting to a voltage, limiting it
+        # and converting back is the same as limiting the position directly
+        pos_lo, pos_hi = POSITION_LIMITS[axis]
+        pos = pos + POSITION_CENTRE_CORRECTION[axis]
+        return pos_lo if pos < pos_lo else (pos_hi if pos > pos_hi else pos)
 
     @staticmethod
     def _replace_any_bit(val: int, pos: int, new_bit: int) -> int:
         """Replace bit at position (starting at 0) with new bit.
 
-        Helper function for Point._binary_coarsen
-
         Parameters
         ----------
         val : int
@@ -912,10 +1498,12 @@ class Point():
 
         Examples
         --------
-        >>> Point._replace_any_bit(10, 2, 0)
+        >>> Point._replace_any_bit(10, 1, 0)
         8
+        >>> Point._replace_any_bit(10, 2, 1)
+        14
         """
-        part1 = val & (~1 << pos)       # replaces bit at pos with 0
+        part1 = val & ~(1 << pos)       # replaces bit at pos with 0
         part2 = new_bit << pos          # shifts new_bit to pos
         replaced = part1 | part2        # replaces 0 with new_bit at pos
         return replaced
@@ -926,31 +1514,165 @@ class Point():
 
         Parameters
         ----------
-        val : int
-            Integer to coarsen, unsigned.
+        val : int or array of ints
+            Integer to coarsen, unsigned. Arrays are coarsened elementwise.
         coarsen : int
             Bit value to coarsen by.
 
         Returns
         -------
-        val : int
+        val : int or array of ints
             Coarsened value.
 
         Examples
         --------
         >>> Point._binary_coarsen(192830999, 4)
         192831000
+        >>> Point._binary_coarsen(np.array([0, 31, 255]), 3)
+        array([  4,  28, 252])
         """
-        if coarsen == 4:
-            # special case to coarsen by 4 for speediness
-            # 8 is "1000" in binary
-            coarsened = ((val >> 4) << 4) | 8
-        else:
-            for k in range(coarsen):
-                if k < (coarsen - 1):
-                    # replace every LSB from coarsen amount by 0
-                    coarsened = Point._replace_any_bit(val, k, 0)
-                else:
-                    # replace coarsen amount pos by 1
-                    coarsened = Point._replace_any_bit(val, k, 1)
+        # clear every bit below the coarsen amount, then set the highest of
+        # them, e.g. for coarsen=4 the mask is "1111" and the middle is "1000"
+        mask = (1 << coarsen) - 1
+        coarsened = (val & ~mask) | (1 << (coarsen - 1))
         return coarsened
+
+class Trajectory():
+    """
+    Many points in space stored as parallel arrays rather than Point objects.
+
+    Positions, voltages and bits of every point are converted in batches with
+    Point.from_array. Points can be on different axes, the axis of each point
+    is stored as its index in AXES.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of points to allocate space for, by default 0. More space is
+        allocated when points are appended past it.
+
+    Attributes
+    ----------
+    axes
+    pos
+    voltage
+    bit
+
+    Examples
+    --------
+    >>> traj = Trajectory()
+    >>> traj.append_pos("x", [1400, 2000])
+    >>> traj.append_pos("z", [0])
+    >>> traj.bit
+    array([58120, 54936, 32760], dtype=uint16)
+    >>> traj.to_points()[0].bit
+    58120
+    """
+    def __init__(self, n: int=0):
+        """Inits a Trajectory object."""
+        self._axes = np.empty(n, dtype=np.int8)
+        self._pos = np.empty(n, dtype=np.float64)
+        self._voltage = np.empty(n, dtype=np.float64)
+        self._bit = np.empty(n, dtype=np.uint16)
+        self._n = 0
+
+    def __len__(self) -> int:
+        """Return the number of points."""
+        return self._n
+
+    def __add__(self, other_traj):
+        """Adds the positions of two Trajectories point by point."""
+        self._check_axes(other_traj, "Adding")
+        return self._from_axes_pos(self.axes, self.pos + other_traj.pos)
+
+    def __sub__(self, other_traj):
+        """Subtracts the positions of two Trajectories point by point."""
+        self._check_axes(other_traj, "Subtracting")
+        return self._from_axes_pos(self.axes, self.pos - other_traj.pos)
+
+    @property
+    def axes(self) -> np.array:
+        """Return the index in AXES of the axis of every point."""
+        return self._axes[:self._n]
+
+    @property
+    def pos(self) -> np.array:
+        """Return absolute positions of every point in μm."""
+        return self._pos[:self._n]
+
+    @property
+    def voltage(self) -> np.array:
+        """Return voltages of every point in Volts."""
+        return self._voltage[:self._n]
+
+    @property
+    def bit(self) -> np.array:
+        """Return the closest bits of every point as 16bit unsigned integers."""
+        return self._bit[:self._n]
+
+    def append_pos(self, axis: str, pos):
+        """
+        Append points on a single axis given their positions in μm.
+
+        Parameters
+        ----------
+        axis : str
+            Dimension of the points, related to the Galvo axis.
+        pos : array_like
+            Absolute positions of the points in μm.
+        """
+        positions, volts, bits = Point.from_array(axis, pos=np.atleast_1d(pos))
+        start = self._n
+        self._reserve(start + positions.size)
+        self._axes[start:self._n] = AXES.index(axis)
+        self._pos[start:self._n] = positions
+        self._voltage[start:self._n] = volts
+        self._bit[start:self._n] = bits
+
+    def to_points(self) -> list:
+        """Return the points as a list of Point objects."""
+        return [
+            Point(AXES[ax], pos=pos) for ax, pos in zip(self.axes, self.pos)
+            ]
+
+    #=======================================================
+    # PRIVATE METHODS
+    #=======================================================
+
+    def _reserve(self, n: int):
+        """Set the number of points to n, growing the arrays if needed."""
+        if n > self._pos.size:
+            size = max(n, 2 * self._pos.size)
+            self._axes = np.resize(self._axes, size)
+            self._pos = np.resize(self._pos, size)
+            self._voltage = np.resize(self._voltage, size)
+            self._bit = np.resize(self._bit, size)
+        self._n = n
+
+    def _check_axes(self, other_traj, operation: str):
+        """Raise ValueError if two Trajectories have points on different axes."""
+        if len(self) != len(other_traj) or np.any(self.axes != other_traj.axes):
+            raise ValueError(
+                "{0} two trajectories with points in different axes.".format(operation))
+
+    @staticmethod
+    def _from_axes_pos(axes: np.array, pos: np.array):
+        """Return a Trajectory from axis indices and positions in μm."""
+        traj = Trajectory(pos.size)
+        traj._reserve(pos.size)
+        traj._axes[:] = axes
+        for ax_idx, ax in enumerate(AXES):
+            on_axis = axes == ax_idx
+            positions, volts, bits = Point.from_array(ax, pos=pos[on_axis])
+            traj._pos[on_axis] = positions
+            traj._voltage[on_axis] = volts
+            traj._bit[on_axis] = bits
+        return traj
+
+# Position to bit conversion specialised for each axis, memoised on the exact
+# position as trajectories often return to the same positions. The slope,
+# intercept, centre correction and position limits are fixed at import, so
+# changing the constants above at runtime doesn't change these conversions
+_POS_TO_BIT = {
+    ax: lru_cache(maxsize=8192)(Point._axis_pos_to_bit(ax)) for ax in AXES
+}
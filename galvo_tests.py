@@ -1,3 +1,7 @@
+import asyncio
+
+import numpy as np
+
 from galvo import *
 
 def saturation_test_point():
@@ -29,6 +33,217 @@ def saturation_test_point():
     print(p.bit)
     print("")
 
+def bit_coarsen_test():
+    # upshifting then coarsening every 12bit level must equal setting the
+    # middle bit directly, as done in Point.bit
+    shift = DAC_SET_BITS - DAC_BITS
+    for level in range(2**DAC_BITS):
+        coarsened = Point._binary_coarsen(level << shift, shift)
+        assert coarsened == (level << shift) | MIDDLE_BIT, level
+    print("bit coarsening matches for all {0} levels".format(2**DAC_BITS))
+
+def bit_conversion_test():
+    # closest level found by searching every DAC voltage step, as Point.bit
+    # used to
+    levels = np.linspace(DAC_RANGE[0], DAC_RANGE[1], num=2**DAC_BITS, endpoint=True)
+    def closest_bit(volt):
+        level = abs(levels - volt).argmin()
+        return (int(level) << (DAC_SET_BITS - DAC_BITS)) | MIDDLE_BIT
+
+    # every level, a quarter and three quarters of the way to the next level
+    # and voltages out of range. Voltages within rounding of the exact middle
+    # of two levels are equally close to both so aren't compared
+    spacing = np.diff(levels)
+    volts = np.concatenate((
+        levels,
+        levels[:-1] + 0.25*spacing,
+        levels[:-1] + 0.75*spacing,
+        [-100, -1, -1e-9, 5 + 1e-9, 5.3, 6, 100]
+        ))
+    expected = [closest_bit(volt) for volt in volts]
+    for volt, bit in zip(volts, expected):
+        assert Point.volt_to_bit(float(volt)) == bit, volt
+    for ax in AXES:
+        # from_array first limits to the axis voltage range, which includes
+        # the saturation compensation above the DAC range
+        limited = np.clip(volts, *VOLTAGE_LIMITS[ax])
+        bits = Point.from_array(ax, voltage=volts)[2]
+        assert bits.tolist() == [closest_bit(volt) for volt in limited], ax
+
+    positions = np.linspace(-20000, 20000, 40001)
+    for ax in AXES:
+        expected = [Point(ax, pos).bit for pos in positions.tolist()]
+        assert [Point.pos_to_bit(ax, pos) for pos in positions.tolist()] == expected, ax
+        assert Point.positions_to_bits(ax, positions).tolist() == expected, ax
+    print("bit conversions match the closest level search")
+
+def replace_bit_test():
+    # only the bit at pos should change, every other bit is kept
+    for val in range(2**8):
+        for pos in range(8):
+            for new_bit in (0, 1):
+                replaced = Point._replace_any_bit(val, pos, new_bit)
+                assert (replaced >> pos) & 1 == new_bit, (val, pos, new_bit)
+                assert replaced & ~(1 << pos) == val & ~(1 << pos), (val, pos, new_bit)
+    print("bit replacing only changes the given bit")
+
+def trajectory_test():
+    # mixed axes, including positions outside the range of either axis
+    axes = ["x", "z", "z", "x", "x", "z"]
+    pos_a = [1400, -8000, 300, 13000, 600, 6000]
+    pos_b = [2000, 5000, -300, 900, -200, 1000]
+
+    # starting small so appending has to grow the arrays
+    traj_a = Trajectory(2)
+    traj_b = Trajectory()
+    for ax, a, b in zip(axes, pos_a, pos_b):
+        traj_a.append_pos(ax, a)
+        traj_b.append_pos(ax, [b])
+    assert len(traj_a) == len(axes)
+
+    points_a = [Point(ax, a) for ax, a in zip(axes, pos_a)]
+    points_b = [Point(ax, b) for ax, b in zip(axes, pos_b)]
+    assert traj_a.pos.tolist() == [p.pos for p in points_a]
+    assert traj_a.voltage.tolist() == [p.voltage for p in points_a]
+    assert traj_a.bit.tolist() == [p.bit for p in points_a]
+
+    for i, point in enumerate(traj_a.to_points()):
+        assert point.bit == traj_a.bit[i], i
+
+    # adding and subtracting limits the result as Point does
+    for traj, points in (
+            (traj_a + traj_b, [a + b for a, b in zip(points_a, points_b)]),
+            (traj_a - traj_b, [a - b for a, b in zip(points_a, points_b)])):
+        assert traj.axes.tolist() == traj_a.axes.tolist()
+        assert traj.pos.tolist() == [p.pos for p in points]
+        assert traj.bit.tolist() == [p.bit for p in points]
+
+    # different axes or a different number of points can't be combined
+    traj_c = Trajectory()
+    traj_c.append_pos("z", pos_a)
+    traj_d = Trajectory()
+    traj_d.append_pos("x", pos_a[:-1])
+    for other in (traj_c, traj_d):
+        for operation in (traj_a.__add__, traj_a.__sub__):
+            try:
+                operation(other)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("mismatched axes should raise ValueError")
+    print("trajectories match points")
+
+def history_test():
+    # enough moves to trim a bounded history several times, even when its
+    # buffer only trims once it is full at HISTORY_INIT_SIZE
+    n_moves = 3*HISTORY_INIT_SIZE
+    for history_size in (1, 2, 3, 7, 1000):
+        bounded = GalvoDriver("z", "DAC0", history_size=history_size)
+        unbounded = GalvoDriver("z", "DAC0")
+        for i in range(n_moves):
+            pos = (i * 7919) % 12000 - 6000
+            for driver in (bounded, unbounded):
+                driver.go_to(pos, 0)
+                if i % 11 == 0:
+                    driver._revert_pos()
+            # read at irregular points so only part of the history has been
+            # converted when it is trimmed
+            if i % 7 == 3 or i % 13 == 0:
+                assert bounded.pos_history == unbounded.pos_history[-history_size:], (history_size, i)
+        assert bounded.pos_history == unbounded.pos_history[-history_size:], history_size
+
+    for history_size in (0, -1, 2.5, "3"):
+        try:
+            GalvoDriver("z", "DAC0", history_size=history_size)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("history_size={0!r} should raise ValueError".format(history_size))
+    print("bounded histories match the end of the full history")
+
+class StubUpdater:
+    """Records every update and reads back the last bits as voltages."""
+    def __init__(self, dac_names):
+        self.dac_names = dac_names
+        self.calls = []
+        self.volts = {name: 0.0 for name in dac_names}
+
+    def update(self, bits):
+        self.calls.append(tuple(int(bit) for bit in bits))
+        for name, bit in zip(self.dac_names, bits):
+            self.volts[name] = int(bit) / 2**DAC_SET_BITS * DAC_RANGE[1]
+        return dict(self.volts)
+
+    def read(self):
+        return dict(self.volts)
+
+class StubStreamer:
+    """Records every stream and ends it at the last bits."""
+    def __init__(self, updater):
+        self.updater = updater
+        self.streams = []
+
+    def configure_stream(self):
+        pass
+
+    def load_data(self, data, data_type):
+        # copied as a reused stream buffer is overwritten by the next move
+        self.streams.append([np.array(bits).tolist() for bits in data])
+
+    def start_stream(self, t):
+        self.updater.update(tuple(bits[-1] for bits in self.streams[-1]))
+        return t
+
+class StubDaq:
+    def __init__(self, dac_names):
+        self.update = StubUpdater(dac_names)
+        self.stream_out = StubStreamer(self.update)
+
+def go_to_many_test():
+    positions = [-1, 6, 2000, 12300, 1500, 900, 900, -6000]
+    for ax in AXES:
+        single = GalvoDriver(ax, "DAC0", pos_init=300, daq=StubDaq(["DAC0"]))
+        many = GalvoDriver(ax, "DAC0", pos_init=300, daq=StubDaq(["DAC0"]))
+        for driver in (single, many):
+            driver.set_origin(100)
+
+        expected = [single.go_to(pos, 0) for pos in positions]
+        assert many.go_to_many(positions, 0) == expected, ax
+        assert many.daq.update.calls == single.daq.update.calls, ax
+        assert many.pos_history == single.pos_history, ax
+
+        # streamed moves go through go_to for each position
+        expected = [single.go_to(pos, 1000) for pos in positions]
+        assert many.go_to_many(positions, 1000) == expected, ax
+        assert many.daq.stream_out.streams == single.daq.stream_out.streams, ax
+    print("go_to_many matches go_to for each position")
+
+def go_to_async_test():
+    async def move(driver, new_pos, speed):
+        return await driver.go_to_async(new_pos, speed)
+
+    async def move_multi(drivers, speed, **new_pos):
+        return await drivers.go_to_async(speed, **new_pos)
+
+    for speed in (0, 1000):
+        sync = GalvoDriver("z", "DAC0", pos_init=300, daq=StubDaq(["DAC0"]))
+        not_sync = GalvoDriver("z", "DAC0", pos_init=300, daq=StubDaq(["DAC0"]))
+        for pos in (2000, -500, -500, 6000):
+            expected = sync.go_to(pos, speed)
+            assert asyncio.run(move(not_sync, pos, speed)) == expected, (speed, pos)
+        assert not_sync.daq.update.calls == sync.daq.update.calls, speed
+        assert not_sync.daq.stream_out.streams == sync.daq.stream_out.streams, speed
+
+        dac_name = {"x": "DAC0", "z": "DAC1"}
+        sync = GalvoDrivers(("x", "z"), dac_name, {"x": 1000, "z": 0}, daq=StubDaq(["DAC0", "DAC1"]))
+        not_sync = GalvoDrivers(("x", "z"), dac_name, {"x": 1000, "z": 0}, daq=StubDaq(["DAC0", "DAC1"]))
+        for new_pos in ({"x": 2000, "z": -300}, {"z": 3000}, {"x": 500, "z": 500}):
+            expected = sync.go_to(speed, **new_pos)
+            assert asyncio.run(move_multi(not_sync, speed, **new_pos)) == expected, (speed, new_pos)
+        assert not_sync.pos == sync.pos, speed
+        assert not_sync.daq.stream_out.streams == sync.daq.stream_out.streams, speed
+    print("go_to_async matches go_to")
+
 def sat_test_galvo():
     driver = GalvoDriver('x', "DAC0", pos_init=0, daq=False)
 
@@ -36,10 +251,13 @@ def sat_test_galvo():
 def general_test():
     driver = GalvoDriver('x', "DAC0", pos_init=0, daq=False)
 
+    # collected and printed once after the loop so the moves aren't timed
+    # with a flush for every print
+    results = []
     for pos in [-1, 6, 2000, 12300, 1500, 900]:
         driver.go_to(pos, 0)
-        print(driver.pos)
-        print(driver.pos_history)
+        results.append((driver.pos, driver.pos_history))
+    print("\n".join("{0}\n{1}".format(*result) for result in results))
 
     driver.set_origin(900)
     print(driver.rel_pos)
@@ -75,4 +293,10 @@ def general_test():
     print(drivers.origin)
 
 if __name__ == '__main__':
-    driver = GalvoDriver('x', "DAC0", pos_init=0, daq=False)
\ No newline at end of file
+    bit_coarsen_test()
+    bit_conversion_test()
+    replace_bit_test()
+    trajectory_test()
+    history_test()
+    go_to_many_test()
+    go_to_async_test()
\ No newline at end of file